@@ -1,14 +1,68 @@
+import errno
+import fcntl
+import functools
+import logging
+import os
 import time
 import subprocess
-import select
+import selectors
+import shutil
+import signal
+import socket
+import struct
 import paramiko
 import sys
+import termios
+import threading
+import tty
 import botocore.exceptions
 
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
+from typing import Callable, Dict, List, Optional, Tuple
 from paramiko.ssh_exception import NoValidConnectionsError, SSHException
 
-from v1.ec2_utils import BastionDefinition
+from v1.ec2_utils import BastionDefinition, get_session
+
+SSH_DISABLED_ALGORITHMS = {
+    'ciphers': ['aes128-cbc', 'aes192-cbc', 'aes256-cbc', '3des-cbc'],
+}
+
+SSH_PORT = 22
+SSH_HANDSHAKE_TIMEOUT = 30
+RECV_BUFFER_SIZE = 65536
+SSH_ESCAPE_CHAR = b'\x1d'
+SSH_WINDOW_SIZE = 134217727
+SSH_REKEY_LIMIT = pow(2, 40)
+SSH_KEEPALIVE_INTERVAL = 30
+SSH_MAX_WORKERS = 16
+SSH_MAX_CONCURRENT_HANDSHAKES = 10
+SSM_COMMAND_POLL_DELAY = 1
+SSM_COMMAND_TIMEOUT = 120
+
+_KEY_CACHE: Dict[str, paramiko.PKey] = {}
+
+_SSH_HANDSHAKES = threading.BoundedSemaphore(SSH_MAX_CONCURRENT_HANDSHAKES)
+
+@functools.lru_cache(maxsize=1)
+def configure_paramiko_logging():
+    """
+    Configures paramiko logging once per process. Logging to a file is only enabled when the
+    BASTION_PARAMIKO_LOG environment variable names a log file, or BASTION_DEBUG is set (logging
+    to /tmp/paramiko.log); otherwise paramiko's records are discarded, so nothing is formatted
+    or written per packet and no stray message can land in a raw-mode terminal.
+    """
+    paramiko_log = os.environ.get('BASTION_PARAMIKO_LOG')
+    if paramiko_log is None and os.environ.get('BASTION_DEBUG'):
+        paramiko_log = '/tmp/paramiko.log'
+
+    if paramiko_log:
+        paramiko.util.log_to_file(paramiko_log, level=logging.INFO)
+    else:
+        paramiko_logger = paramiko.util.get_logger('paramiko')
+        paramiko_logger.setLevel(logging.WARNING)
+        paramiko_logger.addHandler(logging.NullHandler())
+        paramiko_logger.propagate = False
 
 class ServiceType(Enum):
     SSH = auto()
@@ -20,15 +74,23 @@ class ConnectorDefinition(BastionDefinition):
     initiate non-interactive and interactive sessions and includes utility methods 
     to check the operational status and configuration of the instances.
     """
+    VALIDATION_TTL = 15 * 60
+    _aws_validation_cache: Dict[Optional[int], float] = {}
 
-    def __init__(self):
+    def __init__(self, client=None, ssm=None, validate: bool = False):
         """
-        Initializes the ConnectorDefinition instance, sets up logging to a file, 
-        and configures the SSH client with default policies. Also initializes the 
-        service timeouts for SSH and SSM connections.
+        Initializes the ConnectorDefinition instance and configures the SSH client with
+        default policies. Also initializes the service timeouts for SSH and SSM connections.
+        Paramiko logging is configured on first use, see `configure_paramiko_logging`.
+
+        Parameters:
+            client: An existing Boto3 EC2 client to reuse. It isn't required.
+            ssm: An existing Boto3 SSM client to reuse. It isn't required.
+            validate (bool): Flag to also check the AWS credentials against AWS before connecting. It isn't required.
         """
-        super().__init__()
-        paramiko.util.log_to_file('/tmp/paramiko.log')
+        super().__init__(client=client, ssm=ssm)
+        self.validate_remotely = validate
+        configure_paramiko_logging()
         self.ssh_client = paramiko.SSHClient()
         self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         self.services = ['ssh', 'ssm']
@@ -66,7 +128,116 @@ class ConnectorDefinition(BastionDefinition):
         elif interactive is True and command is None:
             self.ssh_interactive_session_handler(instance_id)
 
-    def handle_ssm_interaction(self, interactive: bool, command: str, bastion_name: str):
+    def handle_ssh_interaction_many(self, key_path: str, username: str, command: str, bastion_names: List[str], wait_ssh: int):
+        """
+        Runs a command over SSH on several bastions in parallel and exits. The bastions are looked up
+        with a single describe_instances call, then each one is started if needed, connected to and
+        runs the command in its own worker thread, so the total time is close to the slowest bastion's
+        rather than the sum of all of them. At most SSH_MAX_CONCURRENT_HANDSHAKES connections are
+        being established at once, to stay below the default sshd MaxStartups limit.
+
+        Parameters:
+            key_path (str): The file path to the SSH key for authentication. It is required.
+            username (str): The username for the SSH connections. It is required.
+            command (str): The command to run on every bastion. It is required.
+            bastion_names (List[str]): The names of the bastion hosts to run the command on. It is required.
+            wait_ssh (int): Time in seconds to wait for SSH service to become available. It isn't required.
+
+        Raises:
+            SystemExit: Exits with 0 if the command succeeded on every bastion, 1 otherwise.
+        """
+        if not self.validate_aws_configuration(self.sts if self.validate_remotely else None):
+            self.logger.critical("AWS configuration is not properly set up. Exiting.")
+            sys.exit(1)
+
+        bastion_names = list(dict.fromkeys(bastion_names))
+        try:
+            found = self.find_instances_by_names(bastion_names)
+        except botocore.exceptions.ClientError as e:
+            self.logger.error("Authentication failure with AWS: %s", e.args)
+            sys.exit(1)
+
+        with ThreadPoolExecutor(max_workers=min(SSH_MAX_WORKERS, len(bastion_names))) as executor:
+            futures = {
+                bastion_name: executor.submit(self.run_ssh_command_on_bastion, key_path, username, command,
+                                              bastion_name, found[bastion_name], wait_ssh)
+                for bastion_name in bastion_names
+            }
+
+        sys.stdout.flush()
+        sys.stderr.flush()
+        failed = False
+        for bastion_name, future in futures.items():
+            exit_status, stdout, stderr = future.result()
+            if exit_status != 0:
+                failed = True
+                self.logger.error(f"[{bastion_name}] Command failed with exit status: {exit_status}")
+            else:
+                self.logger.info(f"[{bastion_name}] Command executed successfully")
+
+            if stdout:
+                self.write_chunks(sys.stdout.fileno(), stdout)
+            if stderr:
+                self.write_chunks(sys.stderr.fileno(), stderr)
+
+        sys.exit(1 if failed else 0)
+
+    def run_ssh_command_on_bastion(self, key_path: str, username: str, command: str, bastion_name: str,
+                                   instance: Optional[dict], wait_ssh: int) -> Tuple[int, List[bytes], List[bytes]]:
+        """
+        Makes a bastion operational, connects to it and runs a command, collecting its output.
+        The work is done by a separate connector sharing this one's AWS clients, so it can run in
+        a worker thread next to other bastions. The bastion is resolved from the description found
+        by the batch lookup, so it never depends on a cache entry another worker may have dropped.
+        The connection is closed once the command is done.
+
+        Parameters:
+            key_path (str): The file path to the SSH key for authentication.
+            username (str): The username for the SSH connection.
+            command (str): The command to run on the bastion.
+            bastion_name (str): The name of the bastion host.
+            instance (Optional[dict]): The description of the bastion found by `find_instances_by_names`,
+                                       or None if no instance matched the name.
+            wait_ssh (int): Time in seconds to wait for SSH service to become available.
+
+        Returns:
+            Tuple[int, List[bytes], List[bytes]]: The exit status of the command (1 if the bastion could not
+                                                  be reached or any error occurred) and the chunks of its
+                                                  stdout and stderr.
+        """
+        if instance is None:
+            self.logger.error(f"No bastion instance found for this name: {bastion_name}.")
+            return 1, [], []
+
+        connector = ConnectorDefinition(client=self.client, ssm=self._ssm, validate=self.validate_remotely)
+        connector.bastion = instance["InstanceId"]
+        connector.bastion_name = bastion_name
+        connector.bastion_instance = instance
+        try:
+            instance_id = connector.ensure_instance_operational(ServiceType.SSH, None, wait_ssh)
+            host = connector.get_instance_public_ip(instance_id)
+            with _SSH_HANDSHAKES:
+                connector.ssh_instance_connection_handler(host=host, username=username, key_path=key_path)
+
+            stdout: List[bytes] = []
+            stderr: List[bytes] = []
+            exit_status = connector.execute_ssh_command(command, stdout.extend, stderr.extend)
+            return exit_status, stdout, stderr
+        except paramiko.ssh_exception.ChannelException as e:
+            self.logger.error(f"[{bastion_name}] Channel Error Happened: {e}")
+            return 1, [], []
+        except botocore.exceptions.ClientError as e:
+            self.logger.error(f"[{bastion_name}] AWS Error Happened: {e}")
+            return 1, [], []
+        except SystemExit as e:
+            return e.code if isinstance(e.code, int) else 1, [], []
+        except Exception as e:
+            self.logger.error(f"[{bastion_name}] Unexpected Error Happened: {e!r}")
+            return 1, [], []
+        finally:
+            connector.ssh_client.close()
+
+    def handle_ssm_interaction(self, interactive: bool, command: str, bastion_name: str, command_timeout: int = SSM_COMMAND_TIMEOUT):
         """
         Handles the SSM connection to the EC2 instance specified by the bastion_name.
         Supports both interactive and non-interactive sessions.
@@ -75,6 +246,7 @@ class ConnectorDefinition(BastionDefinition):
             interactive (bool): Flag to determine if the session is interactive. It isn't required.
             command (str): The command to run in a non-interactive session. It isn't required.
             bastion_name (str): The name of the bastion host to connect to. It isn't required.
+            command_timeout (int): Maximum time in seconds to wait for a non-interactive command to finish. It isn't required.
         
         Raises:
             SystemExit: If the session is non-interactive and no command is provided.
@@ -88,22 +260,24 @@ class ConnectorDefinition(BastionDefinition):
         if interactive is True and command is None:
             self.start_interactive_ssm_session(instance_id)
         elif command is not None and interactive is False:
-            self.run_ssm_command_and_exit(command, instance_id)
+            self.run_ssm_command_and_exit(command, instance_id, command_timeout)
 
     # ======= Utils
-    def validate_aws_configuration(self, client) -> bool:
+    def validate_aws_configuration(self, client=None) -> bool:
         """
-        Validates the AWS configuration by attempting to describe AWS regions with the provided client.
-        This function checks if the AWS credentials are correctly set up and can authenticate with AWS.
+        Validates the AWS configuration by resolving the AWS credentials locally, which needs no
+        network round trip. When a client is provided, the credentials are also checked against
+        AWS by calling STS GetCallerIdentity with it. A successful check is remembered per client
+        for VALIDATION_TTL seconds.
     
         Parameters:
-            client: The Boto3 client configured for the AWS service to validate. This client is used
-                    to perform an AWS API operation that requires valid credentials.
+            client: The Boto3 STS client used to perform the GetCallerIdentity call. It isn't required;
+                    without it only the local credential resolution is performed.
     
         Returns:
-            bool: True if the AWS API operation succeeds, indicating valid AWS configuration and credentials.
-                  False if any exceptions related to credentials or authentication are caught, indicating
-                  an issue with the AWS configuration.
+            bool: True if the credentials resolve (and, when checked, authenticate with AWS), indicating
+                  valid AWS configuration and credentials. False if any exceptions related to credentials
+                  or authentication are caught, indicating an issue with the AWS configuration.
     
         Notes:
             This function specifically catches `NoCredentialsError` for missing credentials,
@@ -111,8 +285,19 @@ class ConnectorDefinition(BastionDefinition):
             authentication failures with AWS. In each case, an appropriate error message is logged,
             and False is returned to indicate the failure.
         """
+        cache_key = None if client is None else id(client)
+        validated_at = ConnectorDefinition._aws_validation_cache.get(cache_key)
+        if validated_at is not None and time.monotonic() - validated_at < self.VALIDATION_TTL:
+            return True
+
         try:
-            client.describe_regions()
+            credentials = get_session().get_credentials()
+            if credentials is None:
+                raise botocore.exceptions.NoCredentialsError()
+            credentials.get_frozen_credentials()
+
+            if client is not None:
+                client.get_caller_identity()
         except botocore.exceptions.NoCredentialsError as e:
             self.logger.error("AWS credentials not found: %s", e.args)
             return False
@@ -123,45 +308,101 @@ class ConnectorDefinition(BastionDefinition):
             self.logger.error("Authentication failure with AWS: %s", e.args) 
             return False
         
+        ConnectorDefinition._aws_validation_cache[cache_key] = time.monotonic()
         return True
+
+    @classmethod
+    def invalidate_aws_validation(cls):
+        """
+        Forgets every successful AWS configuration check, so the next call to
+        `validate_aws_configuration` checks the credentials again.
+        """
+        cls._aws_validation_cache.clear()
     
-    def ensure_instance_operational(self, service: ServiceType, bastion_name: str, wait_ssh: int) -> str:
+    def ensure_instance_operational(self, service: ServiceType, bastion_name: str, wait_ssh: int = 0) -> str:
         """
         Ensures that the specified EC2 instance is operational and starts it if needed.
-        If the service is SSH, it waits for the SSH service to initialize in case instance isn't already running.
+        If the service is SSH, it waits for the SSH service to accept connections in case instance isn't already running.
+        The instance ID and state are resolved with a single describe_instances call. After a
+        start, the new public IP address comes from the description polled while waiting for the
+        instance to run, which later lookups reuse.
 
         Parameters:
             service (ServiceType): The service type (SSH or SSM) being requested.
             bastion_name (str): The name of the bastion host to check.
-            wait_ssh (int): Time in seconds to wait for SSH service to become available.
+            wait_ssh (int): Maximum time in seconds to wait for SSH service to become available. Only used for SSH.
 
         Returns:
             str: The instance ID of the operational instance.
 
         Raises:
-            SystemExit: If the AWS configuration is not properly set up.
+            SystemExit: If the AWS configuration is not properly set up, or AWS rejects the credentials.
         """
-        if not self.validate_aws_configuration(self.client):
+        if not self.validate_aws_configuration(self.sts if self.validate_remotely else None):
             self.logger.critical("AWS configuration is not properly set up. Exiting.")
             sys.exit(1)
 
-        instance_id = self.find_instance_by_name(bastion_name)
-        instance_state = self.get_instance_state(instance_id)
+        try:
+            instance_id, instance_state, _ = self.resolve(bastion_name)
+        except botocore.exceptions.ClientError as e:
+            self.logger.error("Authentication failure with AWS: %s", e.args)
+            sys.exit(1)
+
+        if instance_state not in ["running", "stopped"]:
+            self.logger.error("Bastion is neither stopped or running")
+            sys.exit(1)
 
         if instance_state == 'stopped':
             self.logger.info("Bastion stopped, starting it")
             self.start_instance(instance_id)
             if service == ServiceType.SSH:
-                self.logger.info(f"Waiting {wait_ssh} seconds for SSH service to initialize.")
-                time.sleep(wait_ssh)
+                host = self.get_instance_public_ip(instance_id)
+                self.logger.info(f"Waiting up to {wait_ssh} seconds for SSH service to initialize.")
+                if not self.wait_for_ssh(host, wait_ssh):
+                    self.logger.warning(f"SSH service did not answer within {wait_ssh} seconds.")
             self.logger.info("Bastion is now running.")
         
         return instance_id
     
     # ======= SSH
+    def wait_for_ssh(self, host: str, timeout: int) -> bool:
+        """
+        Waits until the SSH service of a host is ready, i.e. accepts TCP connections and sends
+        its protocol banner, so a freshly started bastion is used as soon as its SSH service is
+        up instead of after a fixed delay. Probes back off exponentially from 0.5 to 4 seconds.
+
+        Parameters:
+            host (str): The hostname or IP address of the bastion server.
+            timeout (int): Maximum time in seconds to wait.
+
+        Returns:
+            bool: True if the SSH service sent its banner, False if the timeout was reached first.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.5
+        while True:
+            try:
+                with socket.create_connection((host, SSH_PORT), timeout=1) as sock:
+                    sock.settimeout(2)
+                    if sock.recv(4) == b"SSH-":
+                        return True
+            except OSError:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 4)
+
     def ssh_instance_connection_handler(self, host: str, username: str, key_path: str):
         """
         Establishes an SSH connection to a specified host using the given username and key file.
+        The transport is compressed and restricted to the AES-CTR ciphers, which are the fastest
+        ones paramiko supports. The private key is parsed once per process and reused. Waiting
+        for the server banner and for authentication is bounded, so a half-started SSH service
+        fails fast instead of hanging.
 
         Parameters:
             host (str): The hostname or IP address of the bastion server to connect to.
@@ -173,7 +414,12 @@ class ConnectorDefinition(BastionDefinition):
                         or an SSH error occurs.
         """
         try:
-            self.ssh_client.connect(hostname=host, username=username, key_filename=key_path)
+            pkey = self.load_private_key(key_path)
+            credentials = {'pkey': pkey} if pkey is not None else {'key_filename': os.path.expanduser(key_path)}
+            self.ssh_client.connect(hostname=host, username=username, **credentials,
+                                    compress=True, disabled_algorithms=SSH_DISABLED_ALGORITHMS,
+                                    banner_timeout=SSH_HANDSHAKE_TIMEOUT, auth_timeout=SSH_HANDSHAKE_TIMEOUT)
+            self.tune_transport(self.ssh_client.get_transport())
             self.logger.info('Successfully connected to bastion')
         except NoValidConnectionsError as e:
             self.logger.error(f"SSH Connection could not be established: {e}")
@@ -184,73 +430,231 @@ class ConnectorDefinition(BastionDefinition):
         except SSHException as e:
             self.logger.error(f"SSH Error Connection Happened: {e}")
             sys.exit(1)
+        except OSError as e:
+            self.logger.error(f"SSH key could not be read: {e}")
+            sys.exit(1)
+
+    @staticmethod
+    def tune_transport(transport: paramiko.Transport):
+        """
+        Tunes a connected SSH transport for bulk output. Channels opened afterwards advertise a
+        large receive window, so the server can keep streaming instead of stalling every 64 KiB
+        for a window adjustment, and re-keying is pushed far enough out not to interrupt a session.
+        Nagle's algorithm is disabled so keystrokes are sent immediately, and keepalives stop
+        NAT gateways from silently dropping idle sessions.
+
+        Parameters:
+            transport (paramiko.Transport): The transport of the connected SSH client.
+        """
+        transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        transport.set_keepalive(SSH_KEEPALIVE_INTERVAL)
+        transport.default_window_size = SSH_WINDOW_SIZE
+        transport.packetizer.REKEY_BYTES = SSH_REKEY_LIMIT
+        transport.packetizer.REKEY_PACKETS = SSH_REKEY_LIMIT
+
+    def load_private_key(self, key_path: str) -> Optional[paramiko.PKey]:
+        """
+        Loads the SSH private key at the given path, parsing it only the first time it is requested.
+        The key type (Ed25519, ECDSA, RSA) is detected from the file contents.
+
+        Parameters:
+            key_path (str): The file path to the private key used for SSH authentication.
+
+        Returns:
+            Optional[paramiko.PKey]: The parsed private key, or None if it is passphrase-protected or
+                                     could not be parsed. The caller then lets paramiko load the key
+                                     file itself, so a key already unlocked in ssh-agent still works.
+
+        Raises:
+            OSError: If the key file could not be read.
+        """
+        real_path = os.path.realpath(os.path.expanduser(key_path))
+        pkey = _KEY_CACHE.get(real_path)
+        if pkey is None:
+            try:
+                pkey = paramiko.PKey.from_path(real_path)
+            except (paramiko.ssh_exception.PasswordRequiredException, TypeError):
+                self.logger.info("SSH key is passphrase-protected, falling back to ssh-agent")
+                return None
+            except (SSHException, ValueError) as e:
+                self.logger.warning(f"SSH key could not be parsed ({e}), falling back to ssh-agent")
+                return None
+            _KEY_CACHE[real_path] = pkey
+
+        return pkey
 
     def ssh_interactive_session_handler(self, bastion_id: str):
         """
-        Manages an interactive SSH session with the connected host. Listens to both user input
-        and server output to provide an interactive terminal experience. Exits on 'exit' command
-        or when the session timeout is reached.
+        Manages an interactive SSH session with the connected host. Blocks on both user input
+        and server output to provide an interactive terminal experience, waking up only when
+        either is readable or the idle timeout expires. The local terminal is put in raw mode,
+        so keystrokes (including control keys) are forwarded as they are typed, and restored
+        afterwards. Exits when the remote shell ends (e.g. 'exit' or Ctrl-D), when Ctrl-] is
+        pressed or when the session timeout is reached. When stdin reaches EOF (e.g. piped input),
+        the EOF is passed on to the remote shell, whose output is still read until it ends. When
+        the local terminal is resized, the remote pseudo-terminal is resized to match.
 
         Parameters:
             bastion_id (str): The instance ID of the bastion for which the session is established.
 
         Raises:
             SystemExit: Exits the script with an error code if a channel exception occurs.
+
+        Notes:
+            On the way out, the SSH connection is closed in a background thread while the
+            bastion instance is being stopped, so both shutdowns overlap. SIGWINCH only wakes the
+            selector through a wakeup pipe and the resize request is sent from the loop, since
+            sending it from the signal handler could deadlock on a lock held by `channel.sendall`.
         """
+        stdin_fd = sys.stdin.fileno()
+        stdin_tty_attrs = termios.tcgetattr(stdin_fd) if sys.stdin.isatty() else None
+
         try:
-            channel = self.ssh_client.invoke_shell()
+            width, height = shutil.get_terminal_size()
+            channel = self.ssh_client.invoke_shell(term=os.environ.get('TERM', 'vt100'), width=width, height=height)
             self.logger.info('Interactive SSH session established')
 
-            last_input_time = time.time()
-
-            while True:
-                r, _, _ = select.select([channel, sys.stdin], [], [], 0.1)
-                current_time = time.time()
-
-                if channel in r:
-                    while channel.recv_ready():
-                        sys.stdout.write(channel.recv(1024).decode('utf-8'))
-                        sys.stdout.flush()
-                        last_input_time = current_time
-
-                    while channel.recv_stderr_ready():
-                        sys.stderr.write(channel.recv_stderr(1024).decode('utf-8'))
-                        sys.stderr.flush()
-                        last_input_time = current_time
-
-                if sys.stdin in r:
-                    command = sys.stdin.readline()
-                    if command.lower().strip() == 'exit':
-                        self.logger.info('Exiting the interactive shell')
+            ssh_timeout = self.timeouts['ssh']
+            monotonic = time.monotonic
+            write_chunks = self.write_chunks
+            sys.stdout.flush()
+            sys.stderr.flush()
+            stdout_fd = sys.stdout.fileno()
+            stderr_fd = sys.stderr.fileno()
+            current_time = last_input_time = monotonic()
+            timed_out = False
+            escaped = False
+
+            channel_fd = channel.fileno()
+            selector = selectors.DefaultSelector()
+            selector.register(channel_fd, selectors.EVENT_READ)
+            selector.register(stdin_fd, selectors.EVENT_READ)
+
+            resize_fd, wakeup_fd = os.pipe()
+            os.set_blocking(wakeup_fd, False)
+            selector.register(resize_fd, selectors.EVENT_READ)
+            previous_sigwinch = signal.signal(signal.SIGWINCH, lambda *_: None)
+            previous_wakeup_fd = signal.set_wakeup_fd(wakeup_fd, warn_on_full_buffer=False)
+
+            if stdin_tty_attrs is not None:
+                tty.setraw(stdin_fd)
+
+            try:
+                while True:
+                    idle_timeout = max(0, last_input_time + ssh_timeout - current_time)
+                    ready = {key.fd for key, _ in selector.select(idle_timeout)}
+                    current_time = monotonic()
+
+                    if resize_fd in ready:
+                        os.read(resize_fd, RECV_BUFFER_SIZE)
+                        channel.resize_pty(*shutil.get_terminal_size())
+
+                    if channel_fd in ready:
+                        chunks = self.drain_channel(channel.recv_ready, channel.recv)
+                        if chunks:
+                            write_chunks(stdout_fd, chunks)
+                            last_input_time = current_time
+
+                        chunks = self.drain_channel(channel.recv_stderr_ready, channel.recv_stderr)
+                        if chunks:
+                            write_chunks(stderr_fd, chunks)
+                            last_input_time = current_time
+
+                    if stdin_fd in ready:
+                        data = os.read(stdin_fd, RECV_BUFFER_SIZE)
+                        if not data:
+                            channel.shutdown_write()
+                            selector.unregister(stdin_fd)
+                            continue
+
+                        escape_at = data.find(SSH_ESCAPE_CHAR)
+                        if escape_at != -1:
+                            channel.sendall(data[:escape_at])
+                            escaped = True
+                            break
+
+                        channel.sendall(data)
+
+                    if channel.exit_status_ready() or channel.eof_received:
                         break
 
-                    channel.send(command)
-
-                if channel.exit_status_ready():
-                    break
-
-                if (current_time - last_input_time) > self.timeouts['ssh']:
-                    self.logger.info(f"Session timeout reached ({self.timeouts['ssh']} seconds). Terminating process. Instance was maintained running.")
-                    break
+                    if (current_time - last_input_time) >= ssh_timeout:
+                        timed_out = True
+                        break
+            finally:
+                selector.close()
+                if stdin_tty_attrs is not None:
+                    termios.tcsetattr(stdin_fd, termios.TCSADRAIN, stdin_tty_attrs)
+                signal.set_wakeup_fd(previous_wakeup_fd)
+                signal.signal(signal.SIGWINCH, previous_sigwinch)
+                os.close(resize_fd)
+                os.close(wakeup_fd)
+
+            if escaped:
+                self.logger.info('Exiting the interactive shell')
+
+            if timed_out:
+                self.logger.info(f"Session timeout reached ({ssh_timeout} seconds). Terminating process. Instance was maintained running.")
         except paramiko.ssh_exception.ChannelException as e:
             self.logger.error(f"Channel Error Happened: {e}")
             sys.exit(1)
         finally:
-            if self.ssh_client.get_transport() is None or not self.ssh_client.get_transport().is_active():
+            transport = self.ssh_client.get_transport()
+            if transport is None or not transport.is_active():
                 self.logger.info('No SSH connection to close')
                 return
             
             self.logger.info('Closing SSH connection')
-            self.ssh_client.close()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                closing = executor.submit(self.ssh_client.close)
+                stopped = self.stop_instance(bastion_id)
+                closing.result()
 
-            if self.stop_instance(bastion_id) is True:
+            if stopped is True:
                 self.logger.info('Process finished.')
 
+    @staticmethod
+    def drain_channel(ready: Callable[[], bool], recv: Callable[[int], bytes]) -> List[bytes]:
+        """
+        Reads everything a channel stream currently has buffered, in chunks of up to
+        RECV_BUFFER_SIZE bytes.
+
+        Parameters:
+            ready (Callable[[], bool]): The channel method telling whether data is ready (e.g. `recv_ready`).
+            recv (Callable[[int], bytes]): The matching channel read method (e.g. `recv`).
+
+        Returns:
+            List[bytes]: The chunks read, empty if nothing was ready.
+        """
+        chunks: List[bytes] = []
+        while ready():
+            chunk = recv(RECV_BUFFER_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+
+        return chunks
+
+    @staticmethod
+    def write_chunks(fd: int, chunks: List[bytes]):
+        """
+        Writes the given chunks straight to a file descriptor, bypassing Python's stream
+        buffers, so each batch costs one write() syscall and never needs a separate flush.
+
+        Parameters:
+            fd (int): The file descriptor to write to (e.g. stdout's).
+            chunks (List[bytes]): The chunks to write, in order.
+        """
+        view = memoryview(chunks[0] if len(chunks) == 1 else b"".join(chunks))
+        while view:
+            view = view[os.write(fd, view):]
+
     def run_ssh_command_and_exit(self, command: str):
         """
-        Executes a given command on the connected host via SSH and exits. If the command
-        execution is successful, it prints the output; if not, it prints the error and exits
-        with the command's exit status.
+        Executes a given command on the connected host via SSH and exits. The command's stdout and
+        stderr are streamed to the local stdout and stderr as they arrive, both drained on every
+        wakeup so neither can fill the channel window and stall the command. If the command
+        fails, the script exits with the command's exit status.
 
         Parameters:
             command (str): The command to be executed on the connected host.
@@ -261,23 +665,64 @@ class ConnectorDefinition(BastionDefinition):
         """
         self.logger.info(f"Running command '{command}' using SSH connection.")
         try:
-            _, stdout, stderr = self.ssh_client.exec_command(command)
-            output = stdout.read().decode()
-            error = stderr.read().decode()
-
-            exit_status = stdout.channel.recv_exit_status()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            stdout_fd = sys.stdout.fileno()
+            stderr_fd = sys.stderr.fileno()
+            exit_status = self.execute_ssh_command(
+                command,
+                lambda chunks: self.write_chunks(stdout_fd, chunks),
+                lambda chunks: self.write_chunks(stderr_fd, chunks))
+            self.ssh_client.close()
 
             if exit_status != 0:
-                self.logger.error(f"Command failed with exit status: {exit_status} and error: {error}")
+                self.logger.error(f"Command failed with exit status: {exit_status}")
                 sys.exit(exit_status)
 
-            self.logger.info(f"Command executed successfully: {output}")
-            self.ssh_client.close()
+            self.logger.info("Command executed successfully")
             sys.exit(0)
         except paramiko.ssh_exception.ChannelException as e:
             self.logger.error(f"Channel Error Happened: {e}")
             sys.exit(1)
 
+    def execute_ssh_command(self, command: str, on_stdout: Callable[[List[bytes]], None], on_stderr: Callable[[List[bytes]], None]) -> int:
+        """
+        Executes a command on the connected host and hands its output over as it arrives. Both
+        stdout and stderr are drained on every wakeup, so neither can fill the channel window
+        and stall the command. Once the server sends EOF no more output can arrive, so the loop
+        stops there instead of waking up on the channel's forever-readable pipe.
+
+        Parameters:
+            command (str): The command to be executed on the connected host.
+            on_stdout (Callable[[List[bytes]], None]): Called with each batch of stdout chunks.
+            on_stderr (Callable[[List[bytes]], None]): Called with each batch of stderr chunks.
+
+        Returns:
+            int: The exit status of the command, or -1 if the server closed the channel without one.
+        """
+        channel = self.ssh_client.get_transport().open_session()
+        channel.exec_command(command)
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(channel.fileno(), selectors.EVENT_READ)
+            while True:
+                selector.select()
+                exited = channel.exit_status_ready()
+                eof = channel.eof_received
+
+                chunks = self.drain_channel(channel.recv_ready, channel.recv)
+                if chunks:
+                    on_stdout(chunks)
+
+                chunks = self.drain_channel(channel.recv_stderr_ready, channel.recv_stderr)
+                if chunks:
+                    on_stderr(chunks)
+
+                if exited or eof or channel.closed:
+                    break
+
+        return channel.recv_exit_status()
+
     # ======= AWS SSM Agent
     def start_interactive_ssm_session(self, instance_id: str):
         """
@@ -300,7 +745,7 @@ class ConnectorDefinition(BastionDefinition):
         self.logger.info(f"SSM session ended successfully")
         sys.exit(process_exit_code)
 
-    def run_ssm_command_and_exit(self, command: str, instance_id: str):
+    def run_ssm_command_and_exit(self, command: str, instance_id: str, total_timeout: int = SSM_COMMAND_TIMEOUT):
         """
         Executes a specified command on an EC2 instance using AWS SSM (Systems Manager) and exits.
         The exit code of the process is logged and used to exit the script.
@@ -308,12 +753,13 @@ class ConnectorDefinition(BastionDefinition):
         Parameters:
             command (str): The command to execute on the instance.
             instance_id (str): The ID of the instance to execute the command on.
+            total_timeout (int): Maximum time in seconds to wait for the command to finish.
 
         Raises:
             SystemExit: Exits the script with the process exit code if the command execution fails or succeeds.
         """
         self.logger.info(f"Running command {command} using secure SSM Agent connection for instance '{instance_id}'.")
-        process_exit_code = self.ssm_command_handler(command, instance_id)
+        process_exit_code = self.ssm_command_handler(command, instance_id, total_timeout)
         if process_exit_code != 0:
             self.logger.error(f"Command failed with exit_code: {process_exit_code}")
             sys.exit(process_exit_code)
@@ -324,89 +770,244 @@ class ConnectorDefinition(BastionDefinition):
     def ssm_session_handler(self, instance_id: str) -> int:
         """
         Handles the creation and monitoring of an SSM session with a specified instance.
-        Manages session timeouts and terminates the session if necessary.
+        Manages session timeouts and terminates the session if necessary. When stdin is a
+        terminal, the session runs on a pseudo-terminal proxied by this process, so the
+        timeout is an idle timeout, reset by every keystroke and every output; otherwise
+        it bounds the whole session.
 
         Parameters:
             instance_id (str): The ID of the instance to start an SSM session with.
 
         Returns:
-            int: The exit code of the session process. A non-zero exit code indicates an error.
+            int: The exit code of the session process. A non-zero exit code indicates an error;
+                 -1 means the session timed out and 130 that it was interrupted with Ctrl-C.
 
         Raises:
             SystemExit: Exits the script with an error code if an exception occurs while starting the session.
         """
         command = ["aws", "ssm", "start-session", "--target", instance_id]
-        last_input_time = time.time()
 
+        process = None
         try:
-            process = subprocess.Popen(command)
-            while True:
-                exit_code = process.poll()
-                if exit_code is not None:
-                    break
-                if time.time() - last_input_time > self.timeouts['ssm']:
-                    self.logger.info(f"Session timeout reached ({self.timeouts['ssm']} seconds). Terminating process. Instance was maintained running.")
-                    process.terminate()
-                    process.wait()
-                    exit_code = -1
-                    return exit_code
-                time.sleep(1)
+            if sys.stdin.isatty():
+                process, master_fd = self.spawn_in_pty(command)
+                exit_code = self.proxy_pty_session(process, master_fd, self.timeouts['ssm'])
+            else:
+                process = subprocess.Popen(command)
+                exit_code = self.wait_for_process(process, self.timeouts['ssm'])
+
+            if exit_code is None:
+                self.logger.info(f"Session timeout reached ({self.timeouts['ssm']} seconds). Terminating process. Instance was maintained running.")
+                process.terminate()
+                process.wait()
+                exit_code = -1
+                return exit_code
 
             if exit_code != 0:
                 return exit_code
             
             self.stop_instance(instance_id)
             return exit_code
+        except KeyboardInterrupt:
+            self.logger.info("Session interrupted. Terminating process. Instance was maintained running.")
+            if process is not None:
+                process.terminate()
+                process.wait()
+            return 130
         except (ValueError, subprocess.CalledProcessError) as e:
             self.logger.error(f"Failed to start session: {e}")
             sys.exit(1)
 
-    def ssm_command_handler(self, command: str, instance_id: str) -> int: # TODO: Include an option to execute another command if the first one fails, timeout, or even succeeds.
+    @staticmethod
+    def spawn_in_pty(command: List[str]) -> Tuple[subprocess.Popen, int]:
+        """
+        Starts a command on a new pseudo-terminal, sized like the local terminal, which becomes
+        the command's controlling terminal.
+
+        Parameters:
+            command (List[str]): The command to run.
+
+        Returns:
+            Tuple[subprocess.Popen, int]: The started process and the master side of the pseudo-terminal.
+        """
+        master_fd, slave_fd = os.openpty()
+        try:
+            ConnectorDefinition.copy_terminal_size(master_fd)
+            process = subprocess.Popen(command, stdin=slave_fd, stdout=slave_fd, stderr=slave_fd, start_new_session=True,
+                                       preexec_fn=lambda: fcntl.ioctl(0, termios.TIOCSCTTY, 0))
+        except BaseException:
+            os.close(master_fd)
+            raise
+        finally:
+            os.close(slave_fd)
+
+        return process, master_fd
+
+    @staticmethod
+    def copy_terminal_size(master_fd: int):
+        """
+        Sizes a pseudo-terminal like the local terminal.
+
+        Parameters:
+            master_fd (int): The master side of the pseudo-terminal.
+        """
+        size = shutil.get_terminal_size()
+        fcntl.ioctl(master_fd, termios.TIOCSWINSZ, struct.pack('HHHH', size.lines, size.columns, 0, 0))
+
+    def proxy_pty_session(self, process: subprocess.Popen, master_fd: int, idle_timeout: float) -> Optional[int]:
+        """
+        Proxies the local terminal, in raw mode, to a process running on a pseudo-terminal until
+        the process exits or no keystroke or output has gone through for `idle_timeout` seconds.
+        The loop blocks in a selector until either side is readable or the idle deadline is
+        reached, so an idle session costs no wakeups. The pseudo-terminal follows the size of
+        the local terminal. The master side is closed on the way out.
+
+        Parameters:
+            process (subprocess.Popen): The process running on the pseudo-terminal.
+            master_fd (int): The master side of the pseudo-terminal.
+            idle_timeout (float): Maximum idle time in seconds.
+
+        Returns:
+            Optional[int]: The exit code of the process, or None if the idle timeout was reached first.
+        """
+        stdin_fd = sys.stdin.fileno()
+        sys.stdout.flush()
+        stdout_fd = sys.stdout.fileno()
+
+        monotonic = time.monotonic
+        current_time = last_activity_time = monotonic()
+        stdin_tty_attrs = termios.tcgetattr(stdin_fd)
+        previous_sigwinch = signal.signal(signal.SIGWINCH, lambda *_: self.copy_terminal_size(master_fd))
+        selector = selectors.DefaultSelector()
+        selector.register(master_fd, selectors.EVENT_READ)
+        selector.register(stdin_fd, selectors.EVENT_READ)
+        tty.setraw(stdin_fd)
+        try:
+            while True:
+                remaining = last_activity_time + idle_timeout - current_time
+                if remaining <= 0:
+                    return None
+
+                ready = {key.fd for key, _ in selector.select(remaining)}
+                current_time = monotonic()
+
+                if master_fd in ready:
+                    try:
+                        data = os.read(master_fd, RECV_BUFFER_SIZE)
+                    except OSError as e:
+                        if e.errno != errno.EIO:
+                            raise
+                        data = b""
+
+                    if not data:
+                        break
+
+                    self.write_chunks(stdout_fd, [data])
+                    last_activity_time = current_time
+
+                if stdin_fd in ready:
+                    data = os.read(stdin_fd, RECV_BUFFER_SIZE)
+                    if data:
+                        self.write_chunks(master_fd, [data])
+                        last_activity_time = current_time
+                    else:
+                        selector.unregister(stdin_fd)
+        finally:
+            selector.close()
+            termios.tcsetattr(stdin_fd, termios.TCSADRAIN, stdin_tty_attrs)
+            signal.signal(signal.SIGWINCH, previous_sigwinch)
+            os.close(master_fd)
+
+        return process.wait()
+
+    @staticmethod
+    def wait_for_process(process: subprocess.Popen, timeout: float) -> Optional[int]:
         """
-        Sends a command to be executed on an EC2 instance via AWS SSM and monitors the command's execution status.
-        Returns immediately after the command execution starts, and periodically checks for the command's completion.
+        Waits for a child process to exit, for at most `timeout` seconds. Where the platform
+        supports it (Linux 5.3+), the wait is a single selector call on a pidfd, which the
+        kernel wakes exactly when the child exits; elsewhere it falls back to Popen.wait.
+
+        Parameters:
+            process (subprocess.Popen): The child process to wait for.
+            timeout (float): Maximum time in seconds to wait.
+
+        Returns:
+            Optional[int]: The exit code of the process, or None if it was still running at the timeout.
+        """
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except (AttributeError, OSError):
+            try:
+                return process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                return None
+
+        try:
+            with selectors.DefaultSelector() as selector:
+                selector.register(pidfd, selectors.EVENT_READ)
+                events = selector.select(timeout)
+        finally:
+            os.close(pidfd)
+
+        if not events:
+            return None
+
+        return process.wait()
+
+    def ssm_command_handler(self, command: str, instance_id: str, total_timeout: int = SSM_COMMAND_TIMEOUT) -> int: # TODO: Include an option to execute another command if the first one fails, timeout, or even succeeds.
+        """
+        Sends a command to be executed on an EC2 instance via AWS SSM and waits for it to finish with the
+        boto3 'command_executed' waiter, which polls every second and stops as soon as the command reaches a
+        terminal state.
 
         Parameters:
             command (str): The command to be executed on the instance.
             instance_id (str): The ID of the instance where the command is to be executed.
+            total_timeout (int): Maximum time in seconds to wait for the command to finish.
 
         Returns:
             int: Returns 0 if the command executed successfully; 1 if the command failed, was cancelled, timed out, 
-                 or if the command status check exceeded the maximum retry count.
+                 or if the command status check exceeded the maximum number of attempts.
 
         Notes:
-            The command execution status is checked with a fixed interval between retries, up to a maximum number of retries.
+            The command execution status is checked every second, for up to `total_timeout` seconds.
         """
-        response = self.ssm.send_command(
-            InstanceIds=[instance_id],
-            DocumentName="AWS-RunShellScript",
-            Comment="Automated command sent by V1 CLI",
-            Parameters={"commands": [command]}
-        )
+        try:
+            response = self.ssm.send_command(
+                InstanceIds=[instance_id],
+                DocumentName="AWS-RunShellScript",
+                Comment="Automated command sent by V1 CLI",
+                Parameters={"commands": [command]}
+            )
+        except botocore.exceptions.ClientError as e:
+            self.logger.error("Authentication failure with AWS: %s", e.args)
+            sys.exit(1)
 
         command_id = response["Command"]["CommandId"]
 
-        max_retries = 12
-        retry_count = 0
-        wait_interval = 5
-
-        while retry_count < max_retries:
-            output = self.ssm.get_command_invocation(
+        waiter = self.ssm.get_waiter('command_executed')
+        try:
+            waiter.wait(
                 CommandId=command_id,
-                InstanceId=instance_id
+                InstanceId=instance_id,
+                WaiterConfig={
+                    'Delay': SSM_COMMAND_POLL_DELAY,
+                    'MaxAttempts': max(1, -(-total_timeout // SSM_COMMAND_POLL_DELAY))
+                }
             )
-
-            if output["Status"] == "Success":
-                self.logger.info(f"Command executed successfully: {output['StandardOutputContent'].strip()}")
-                return 0
-
-            if output["Status"] in ["Failed", "Cancelled", "TimedOut"]:
+        except botocore.exceptions.WaiterError as e:
+            output = e.last_response or {}
+            if output.get("Status") in ["Failed", "Cancelled", "Cancelling", "TimedOut"]:
                 if 'StandardErrorContent' in output:
                     self.logger.error(f"Error: {output['StandardErrorContent']}")
                 return 1
-        
-            time.sleep(wait_interval)
-            retry_count += 1
 
-        self.logger.error("Command status check timed out.")
-        return 1
+            self.logger.error(f"Command status check timed out after {total_timeout} seconds.")
+            return 1
+
+        output = self.ssm.get_command_invocation(
+            CommandId=command_id,
+            InstanceId=instance_id
+        )
+        self.logger.info(f"Command executed successfully: {output['StandardOutputContent'].strip()}")
+        return 0
@@ -1,37 +1,160 @@
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
+import functools
 import boto3
+import botocore.config
 import botocore.exceptions
+import os
+import random
 import sys
+import time
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from prompt_toolkit import prompt
-from prompt_toolkit.completion import WordCompleter
 
 from v1.logger import LoggerDefinition
 
+if TYPE_CHECKING:
+    from rich.panel import Panel
+    from prompt_toolkit.completion import FuzzyCompleter
+
+INSTANCE_STATES = ["pending", "running", "stopping", "stopped"]
+
+# States from which an instance can no longer reach any state it is being waited for. 'stopped'
+# is not one of them: describe_instances is eventually consistent, so an instance that was just
+# started can still be reported as stopped.
+DEAD_END_STATES = {"shutting-down", "terminated"}
+
+_CLIENT_CONFIG = botocore.config.Config(
+    max_pool_connections=50,
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True)
+
+@functools.lru_cache(maxsize=None)
+def get_session(profile_name: Optional[str] = None) -> boto3.session.Session:
+    """
+    Returns the boto3 session for an AWS profile, shared by the whole process and created on first use.
+
+    Parameters:
+        profile_name (str, optional): The AWS profile name. Defaults to None, which lets boto3 pick
+                                      the profile from AWS_PROFILE or the default one.
+    """
+    return boto3.session.Session(profile_name=profile_name)
+
+def get_client(service_name: str, region_name: Optional[str] = None, profile_name: Optional[str] = None):
+    """
+    Returns the Boto3 client for an AWS service, creating it on first use. Clients are built
+    from the shared session, in the given region or else the one taken from AWS_REGION or the
+    session configuration, and reused by every caller in the process asking for the same
+    service, region and profile. Their HTTP connection pool is sized for parallel callers and
+    kept alive with TCP keepalives, and throttled calls are retried adaptively.
+
+    Parameters:
+        service_name (str): The AWS service name ('ec2', 'ssm', 'sts', etc.).
+        region_name (str, optional): The AWS region name. Defaults to None.
+        profile_name (str, optional): The AWS profile name. Defaults to None.
+    """
+    region_name = region_name or os.environ.get('AWS_REGION') or get_session(profile_name).region_name
+    return _create_client(service_name, region_name, profile_name)
+
+@functools.lru_cache(maxsize=None)
+def _create_client(service_name: str, region_name: Optional[str], profile_name: Optional[str]):
+    return get_session(profile_name).client(service_name, region_name=region_name, config=_CLIENT_CONFIG)
+
+def instance_name(instance: dict) -> Optional[str]:
+    """
+    Returns the value of an instance's 'Name' tag, stopping at the first matching tag.
+
+    Parameters:
+        instance (dict): The description of the instance, as returned by describe_instances.
+
+    Returns:
+        Optional[str]: The instance name, or None if the instance has no 'Name' tag.
+    """
+    return next((tag["Value"] for tag in instance.get("Tags", ()) if tag["Key"] == "Name"), None)
+
+@functools.lru_cache(maxsize=8)
+def instance_picker(instances: Tuple[str, ...]) -> Tuple["Panel", "FuzzyCompleter"]:
+    """
+    Builds the table and completer used to pick an instance by name, once per list of names.
+    The completer matches the whole input fuzzily and case-insensitively against the names,
+    including names with spaces or dashes, so a few characters of a name are enough to select it.
+
+    Parameters:
+        instances (Tuple[str, ...]): The instance names to choose from.
+
+    Returns:
+        Tuple[Panel, FuzzyCompleter]: The panel listing the names and the completer for the prompt.
+
+    Notes:
+        rich and prompt_toolkit are only imported here, since the picker is only needed when a
+        bastion name does not match, and importing them slows down every CLI start.
+    """
+    from prompt_toolkit.completion import FuzzyCompleter, WordCompleter
+    from rich.panel import Panel
+    from rich.table import Table
+
+    table = Table(title="Instances", show_lines=True, header_style="bold magenta")
+    table.add_column("Instance Name", style="dim", justify="center")
+    for instance in instances:
+        table.add_row(instance)
+
+    panel = Panel.fit(table, title="Select a bastion instance (type 'exit' to cancel)", border_style="green")
+    completer = WordCompleter(list(instances) + ["exit"], ignore_case=True, sentence=True)
+    return panel, FuzzyCompleter(completer, pattern=r'^.*')
+
 class BastionDefinition:
     """
     Defines a class that encapsulates operations related to AWS EC2 bastion instances,
     including finding instances by name, checking and changing instance states, and
     managing instance connectivity.
     """
-    def __init__(self):
+    CACHE_TTL = 15 * 60
+    STATE_TTL = 60
+    _instance_cache: Dict[str, Tuple[dict, float]] = {}
+    _describe_cache: Dict[tuple, Tuple[List[dict], float]] = {}
+
+    def __init__(self, client=None, ssm=None):
         """
-        Initializes the BastionDefinition instance by setting up AWS clients for EC2 and SSM,
-        and configuring a logger for logging purposes.
+        Initializes the BastionDefinition instance and configures a logger for logging purposes.
+        The AWS clients for EC2, SSM and STS are only created when first used, from a process-wide
+        cache, so credentials resolution and the service models are loaded only once.
+
+        Parameters:
+            client: An existing Boto3 EC2 client to reuse. It isn't required.
+            ssm: An existing Boto3 SSM client to reuse. It isn't required.
         """
         self.bastion = None
-        self.client = boto3.client('ec2')
-        self.ssm = boto3.client('ssm')
+        self.bastion_name = None
+        self.bastion_instance = None
+        self._client = client
+        self._ssm = ssm
+        self._sts = None
         self.logger = LoggerDefinition.logger()
+
+    @property
+    def client(self):
+        """The Boto3 EC2 client."""
+        if self._client is None:
+            self._client = get_client('ec2')
+        return self._client
+
+    @property
+    def ssm(self):
+        """The Boto3 SSM client."""
+        if self._ssm is None:
+            self._ssm = get_client('ssm')
+        return self._ssm
+
+    @property
+    def sts(self):
+        """The Boto3 STS client."""
+        if self._sts is None:
+            self._sts = get_client('sts')
+        return self._sts
     
     def find_instance_by_name(self, bastion_name: str = None) -> str:
         """
         Searches for an EC2 instance by its name tag. If multiple instances have the same name,
-        the first match is used. This function can recursively prompt the user to select an
-        instance if the initial name search fails.
+        the first match is used. The user is prompted to select an instance, again and again,
+        until a name matches.
 
         Parameters:
             bastion_name (str, optional): The name of the bastion instance to find. Defaults to None.
@@ -41,28 +164,262 @@ class BastionDefinition:
 
         Notes:
             If no instance is found with the given name, the user is prompted to select an instance
-            from a list of all instances.
-        """
-        if bastion_name is not None:
-            response = self.client.describe_instances()
-            for reservation in response["Reservations"]:
-                for instance in reservation["Instances"]:
-                    for tag in instance["Tags"]:
-                        if tag["Key"] == "Name" and bastion_name.lower() in tag["Value"].lower():
-                            self.bastion = instance["InstanceId"]
-                            return self.bastion
-
-        if self.bastion is None:
+            from a list of all instances. The list is fetched once and reused by every prompt, and
+            a name picked from it is resolved from the same listing, without another API call.
+            The picked instance is cached with the listing's fetch time, not the time of the
+            pick, so its state and public IP are never trusted for longer than STATE_TTL.
+        """
+        instance_names: Optional[List[str]] = None
+        while True:
+            if bastion_name is not None:
+                instance = self.get_cached_instance(bastion_name)
+                if instance is None:
+                    entry = self.find_instance_by_tag(bastion_name)
+                    if entry is not None:
+                        instance = entry[0]
+                        self._instance_cache[bastion_name] = entry
+
+                if instance is not None:
+                    self.bastion = instance["InstanceId"]
+                    self.bastion_name = bastion_name
+                    self.bastion_instance = instance
+                    return self.bastion
+
+            if self.bastion is not None:
+                return self.bastion
+
             self.logger.warning(f"No bastion instance found for this name: {bastion_name}.")
-            list_instance_names: List[str] = self.list_instance_names()
-            selected_bastion_name: str = self.select_instance(list_instance_names)
-            return self.find_instance_by_name(selected_bastion_name)
+            if instance_names is None:
+                instance_names = self.list_instance_names()
+            bastion_name = self.select_instance(instance_names)
+
+            instances, fetched_at = self.describe_named_instances()
+            for instance in instances:
+                if instance_name(instance) == bastion_name:
+                    self._instance_cache[bastion_name] = (instance, fetched_at)
+                    break
+
+    def find_instance_by_tag(self, bastion_name: str) -> Optional[Tuple[dict, float]]:
+        """
+        Looks up the first EC2 instance whose name tag contains the given name.
+        The predicate is pushed to the EC2 API through `Filters`, so only matching instances
+        travel over the wire, in small pages of 5, and the paginator's JMESPath search stops
+        paging on the first hit.
+
+        Parameters:
+            bastion_name (str): The (partial) name of the bastion instance to find.
+
+        Returns:
+            Optional[Tuple[dict, float]]: The description of the first matching instance (including
+                                          its 'InstanceId' and 'PublicIpAddress') and the monotonic
+                                          time it was fetched at, or None if nothing matched.
+
+        Notes:
+            EC2 tag filters are case-sensitive. When the filtered lookup misses, the named
+            instances are scanned once more with a case-insensitive match, as before. That
+            listing is the same one `list_instance_names` uses, so it is fetched only once.
+        """
+        paginator = self.client.get_paginator('describe_instances')
+        filters = [
+            {"Name": "tag:Name", "Values": list(dict.fromkeys([f"*{bastion_name}*", f"*{bastion_name.lower()}*"]))},
+            {"Name": "instance-state-name", "Values": INSTANCE_STATES},
+        ]
+        fetched_at = time.monotonic()
+        pages = paginator.paginate(Filters=filters, PaginationConfig={'PageSize': 5})
+        instance = next(pages.search("Reservations[].Instances[]"), None)
+        if instance is not None:
+            return instance, fetched_at
+
+        needle = bastion_name.casefold()
+        instances, fetched_at = self.describe_named_instances()
+        for instance in instances:
+            name = instance_name(instance)
+            if name and needle in name.casefold():
+                return instance, fetched_at
+
+        return None
+
+    def find_instances_by_names(self, bastion_names: List[str]) -> Dict[str, Optional[dict]]:
+        """
+        Looks up several bastion instances by name with a single paginated describe_instances
+        call, instead of one call per name, and stores the matches in the lookup cache so the
+        following per-name lookups are answered without another API round trip.
+
+        Parameters:
+            bastion_names (List[str]): The (partial) names of the bastion instances to find.
+
+        Returns:
+            Dict[str, Optional[dict]]: The description of the first instance whose name tag contains
+                                       each name (case-insensitively), or None if nothing matched.
+
+        Notes:
+            Names already in the lookup cache are not requested again. EC2 tag filters are
+            case-sensitive, so names the filtered call missed are scanned once more with a
+            case-insensitive match over the named instances, as `find_instance_by_tag` does.
+        """
+        found: Dict[str, Optional[dict]] = {}
+        missing: List[str] = []
+        for bastion_name in dict.fromkeys(bastion_names):
+            found[bastion_name] = self.get_cached_instance(bastion_name)
+            if found[bastion_name] is None:
+                missing.append(bastion_name)
+
+        if not missing:
+            return found
+
+        patterns = dict.fromkeys(pattern for name in missing for pattern in (f"*{name}*", f"*{name.lower()}*"))
+        filters = [
+            {"Name": "tag:Name", "Values": list(patterns)},
+            {"Name": "instance-state-name", "Values": INSTANCE_STATES},
+        ]
+        paginator = self.client.get_paginator('describe_instances')
+        fetched_at = time.monotonic()
+        pages = paginator.paginate(Filters=filters)
+        self._match_names(pages.search("Reservations[].Instances[]"), missing, found, fetched_at)
+
+        missing = [bastion_name for bastion_name in missing if found[bastion_name] is None]
+        if not missing:
+            return found
+
+        instances, fetched_at = self.describe_named_instances()
+        self._match_names(instances, missing, found, fetched_at)
+        return found
+
+    def _match_names(self, instances: Iterable[dict], missing: List[str], found: Dict[str, Optional[dict]], fetched_at: float):
+        """
+        Matches instances against the names that have not been found yet, case-insensitively. Each
+        name is given the first instance whose name tag contains it, and the match is stored in the
+        lookup cache with the time the instances were fetched at.
+
+        Parameters:
+            instances (Iterable[dict]): The descriptions of the instances to match.
+            missing (List[str]): The (partial) names that have not been found yet.
+            found (Dict[str, Optional[dict]]): The matches so far, updated in place.
+            fetched_at (float): The monotonic time the instances were fetched at.
+        """
+        for instance in instances:
+            name = instance_name(instance)
+            if not name:
+                continue
+
+            for bastion_name in missing:
+                if found[bastion_name] is None and bastion_name.casefold() in name.casefold():
+                    found[bastion_name] = instance
+                    self._instance_cache[bastion_name] = (instance, fetched_at)
 
-        return self.bastion
+    def resolve(self, bastion_name: str = None) -> Tuple[str, str, Optional[str]]:
+        """
+        Resolves a bastion instance by name into its instance ID, state and public IP address.
+        All three come from the same describe_instances response used for the name lookup,
+        so a single API round trip (or none, on a cache hit) answers what used to take three.
+        A cached name lookup is reused for CACHE_TTL seconds, but its state and public IP
+        address only for STATE_TTL seconds; older ones are refreshed by instance ID. Instances
+        in a transitional state ('pending', 'stopping') are never cached.
+
+        Parameters:
+            bastion_name (str, optional): The name of the bastion instance to resolve. Defaults to None.
+
+        Returns:
+            Tuple[str, str, Optional[str]]: The instance ID, the instance state ('running', 'stopped', etc.)
+                                            and the public IP address, which is None while the instance
+                                            has no public IP address.
+        """
+        instance_id = self.find_instance_by_name(bastion_name)
+        instance = self.current_instance(instance_id)
+        state = instance["State"]["Name"]
+        if state not in ["running", "stopped"]:
+            self._instance_cache.pop(self.bastion_name, None)
+
+        return instance_id, state, instance.get("PublicIpAddress")
+
+    def current_instance(self, instance_id: str) -> dict:
+        """
+        Returns the description of a specified EC2 instance. The one captured while looking the
+        bastion up by name is reused while it is younger than STATE_TTL seconds and still cached;
+        otherwise the instance is described again.
+
+        Parameters:
+            instance_id (str): The ID of the instance to describe.
+
+        Returns:
+            dict: The description of the instance.
+        """
+        instance = self.bastion_instance
+        cached = self._instance_cache.get(self.bastion_name)
+        if (instance is None or instance["InstanceId"] != instance_id
+                or (self.bastion_name is not None and cached is None)
+                or (cached is not None and time.monotonic() - cached[1] >= self.STATE_TTL)):
+            instance = self.refresh_instance(instance_id)
+
+        return instance
+
+    def refresh_instance(self, instance_id: str) -> dict:
+        """
+        Fetches a fresh description of a specified EC2 instance and keeps it as the current
+        bastion instance. If it is the bastion that was looked up by name, the lookup cache
+        is refreshed as well.
+
+        Parameters:
+            instance_id (str): The ID of the instance to describe.
+
+        Returns:
+            dict: The description of the instance.
+        """
+        response = self.client.describe_instances(InstanceIds=[instance_id])
+        self.bastion_instance = response["Reservations"][0]["Instances"][0]
+        if self.bastion_name is not None and self.bastion == instance_id:
+            self._instance_cache[self.bastion_name] = (self.bastion_instance, time.monotonic())
+
+        return self.bastion_instance
+
+    def get_cached_instance(self, bastion_name: str) -> Optional[dict]:
+        """
+        Returns the instance description cached for the given bastion name, if it is still
+        within the cache TTL.
+
+        Parameters:
+            bastion_name (str): The name the bastion instance was looked up with.
+
+        Returns:
+            Optional[dict]: The cached instance description, or None if absent or expired.
+        """
+        cached = self._instance_cache.get(bastion_name)
+        if cached is None:
+            return None
+
+        instance, fetched_at = cached
+        if time.monotonic() - fetched_at >= self.CACHE_TTL:
+            self._instance_cache.pop(bastion_name, None)
+            return None
+
+        return instance
+
+    def invalidate(self, instance_id: Optional[str] = None):
+        """
+        Drops the cached lookups of an instance, and every cached listing. Must be called whenever
+        an instance changes state, since its cached state and public IP address are no longer accurate.
+        Lookups of other instances are kept, so connectors working on other bastions in parallel
+        keep their cache hits.
+
+        Parameters:
+            instance_id (str, optional): The ID of the instance that changed. Defaults to None, which
+                                         drops every cached lookup.
+        """
+        if instance_id is None:
+            self._instance_cache.clear()
+        else:
+            for bastion_name, (instance, _) in list(self._instance_cache.items()):
+                if instance["InstanceId"] == instance_id:
+                    self._instance_cache.pop(bastion_name, None)
+
+        self._describe_cache.clear()
+        self.bastion_instance = None
     
     def get_instance_state(self, instance_id: str) -> str:
         """
-        Retrieves the current state of a specified EC2 instance.
+        Retrieves the current state of a specified EC2 instance. The state captured while
+        looking the bastion up by name is reused while it is younger than STATE_TTL seconds;
+        otherwise it is read from a describe_instances call, which is kept for later lookups.
 
         Parameters:
             instance_id (str): The ID of the instance whose state is to be checked.
@@ -75,8 +432,7 @@ class BastionDefinition:
                         error occurs while fetching the instance state.
         """
         try:
-            response = self.client.describe_instance_status(InstanceIds=[instance_id], IncludeAllInstances=True)
-            state = response["InstanceStatuses"][0]["InstanceState"]["Name"]
+            state = self.current_instance(instance_id)["State"]["Name"]
 
             if state not in ["running", "stopped"]:
                 self.logger.error("Bastion is neither stopped or running")
@@ -99,10 +455,10 @@ class BastionDefinition:
         """
         try:
             self.client.start_instances(InstanceIds=[instance_id])
+            self.invalidate(instance_id)
             self.logger.info(f"Starting bastion instance")
-            waiter = self.client.get_waiter('instance_running')
             self.logger.info("Waiting for bastion to enter 'running' state")
-            waiter.wait(InstanceIds=[instance_id])
+            self.wait_for_instance_state(instance_id, 'running')
             self.logger.info(f"Bastion instance successfully started")
         except botocore.exceptions.BotoCoreError as e:
             self.logger.error(f"Error starting bastion: {e}")
@@ -130,18 +486,63 @@ class BastionDefinition:
 
         try:
             self.client.stop_instances(InstanceIds=[instance_id])
+            self.invalidate(instance_id)
             self.logger.info(f"Stopping bastion instance")
-            waiter = self.client.get_waiter('instance_stopped')
-            waiter.wait(InstanceIds=[instance_id])
+            self.wait_for_instance_state(instance_id, 'stopped')
             self.logger.info(f"Bastion instance successfully stopped")
             return True
         except botocore.exceptions.BotoCoreError as e:
             self.logger.error(f"Error stopping bastion: {e}")
             sys.exit(1)
     
+    def wait_for_instance_state(self, instance_id: str, target_state: str, timeout: int = 10*60) -> dict:
+        """
+        Polls the state of a specified EC2 instance until it reaches the target state. The
+        poll interval starts at 1 second and backs off to 5 seconds, instead of the fixed
+        15 seconds used by the boto3 waiters. Each interval is jittered, so bastions started
+        together are not polled in lockstep, and never runs past the timeout. The instance is
+        polled with describe_instances, and the last description is kept as the current
+        bastion instance, so the public IP address of a started instance needs no extra call.
+        Waiting stops as soon as the instance enters a state it cannot leave for the target
+        state, such as 'terminated', instead of polling until the timeout.
+
+        Parameters:
+            instance_id (str): The ID of the instance to wait for.
+            target_state (str): The state to wait for ('running', 'stopped', etc.).
+            timeout (int): Maximum time in seconds to wait for the target state.
+
+        Returns:
+            dict: The description of the instance in the target state.
+
+        Raises:
+            SystemExit: If the instance does not reach the target state within the timeout, or
+                        enters a state from which it cannot reach it.
+        """
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            instance = self.refresh_instance(instance_id)
+            state = instance["State"]["Name"]
+            if state == target_state:
+                return instance
+
+            if state in DEAD_END_STATES:
+                self.logger.error(f"Bastion entered '{state}' state while waiting for '{target_state}'")
+                sys.exit(1)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                self.logger.error(f"Bastion did not reach '{target_state}' state within {timeout} seconds")
+                sys.exit(1)
+
+            time.sleep(min(remaining, min(5, 1.5 ** attempt) * random.uniform(0.75, 1.25)))
+            attempt += 1
+
     def get_instance_public_ip(self, instance_id: str) -> str:
         """
-        Retrieves the public IP address of a specified EC2 instance.
+        Retrieves the public IP address of a specified EC2 instance. The address captured
+        while looking the bastion up by name, or while waiting for it to start, is reused when
+        available; otherwise the instance is described once more and the result kept.
 
         Parameters:
             instance_id (str): The ID of the instance whose public IP address is to be retrieved.
@@ -153,9 +554,13 @@ class BastionDefinition:
             SystemExit: If an error occurs while fetching the public IP address or if the instance
                         does not have a public IP address.
         """
-        response = self.client.describe_instances(InstanceIds=[instance_id])
+        if self.bastion_instance is not None and self.bastion_instance["InstanceId"] == instance_id:
+            public_ip = self.bastion_instance.get("PublicIpAddress")
+            if public_ip is not None:
+                return public_ip
+
         try:
-            publicIpAdrr = response["Reservations"][0]["Instances"][0]["PublicIpAddress"]
+            publicIpAdrr = self.refresh_instance(instance_id)["PublicIpAddress"]
             return publicIpAdrr
         except Exception as e:
             self.logger.error(f"Error getting bastion public ip: {e}")
@@ -169,15 +574,47 @@ class BastionDefinition:
         Returns:
             List[str]: A list of instance names.
         """
-        instances: List[str] = []
-        response = self.client.describe_instances()
-        for reservation in response["Reservations"]:
-            for instance in reservation["Instances"]:
-                for tag in instance["Tags"]:
-                    if tag["Key"] == "Name":
-                        instances.append(tag["Value"])
+        instances, _ = self.describe_named_instances()
+        names = (instance_name(instance) for instance in instances)
+        return [name for name in names if name is not None]
+
+    def describe_named_instances(self) -> Tuple[List[dict], float]:
+        """
+        Describes every EC2 instance that has a 'Name' tag and is in INSTANCE_STATES, across all
+        result pages. Only matching instances are requested from the EC2 API.
+
+        Returns:
+            Tuple[List[dict], float]: The descriptions of the instances and the monotonic time
+                                      they were fetched at.
+        """
+        return self._describe_cached((
+            ("tag-key", ("Name",)),
+            ("instance-state-name", tuple(INSTANCE_STATES)),
+        ))
 
-        return instances
+    def _describe_cached(self, filters: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Tuple[List[dict], float]:
+        """
+        Describes the EC2 instances matching the given filters, across all result pages. The
+        result is cached per filter set for STATE_TTL seconds, so repeated listings within a
+        run cost a single paginated describe_instances call.
+
+        Parameters:
+            filters (Tuple[Tuple[str, Tuple[str, ...]], ...]): The (name, values) pairs of the filters.
+
+        Returns:
+            Tuple[List[dict], float]: The descriptions of the matching instances and the monotonic
+                                      time they were fetched at, which may be up to STATE_TTL ago.
+        """
+        cached = self._describe_cache.get(filters)
+        if cached is not None and time.monotonic() - cached[1] < self.STATE_TTL:
+            return cached
+
+        paginator = self.client.get_paginator('describe_instances')
+        pages = paginator.paginate(Filters=[{"Name": name, "Values": list(values)} for name, values in filters])
+        fetched_at = time.monotonic()
+        instances = list(pages.search("Reservations[].Instances[]"))
+        self._describe_cache[filters] = (instances, fetched_at)
+        return instances, fetched_at
     
     def select_instance(self, instances: List[str]) -> str:
         """
@@ -193,14 +630,11 @@ class BastionDefinition:
         Raises:
             SystemExit: If the user exits the selection process.
         """
-        console = Console()
-        table = Table(title="Instances", show_lines=True, header_style="bold magenta")
-        table.add_column("Instance Name", style="dim", justify="center")
-        for instance in instances:
-            table.add_row(instance)
+        from prompt_toolkit import prompt
+        from rich.console import Console
 
-        console.print(Panel.fit(table, title="Select a bastion instance (type 'exit' to cancel)", border_style="green"))
-        completer = WordCompleter(instances + ["exit"], ignore_case=True, sentence=True)
+        panel, completer = instance_picker(tuple(instances))
+        Console().print(panel)
         instance = prompt("Select an instance: ", completer=completer)
 
         if instance == "exit":
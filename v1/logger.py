@@ -1,11 +1,19 @@
+import functools
 import logging
 import colorlog
 
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
 class LoggerDefinition():
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def logger():
         logger = logging.getLogger(__name__)
         logger.setLevel(logging.INFO)
+        logger.propagate = False
 
         if not logger.handlers:
             ch = logging.StreamHandler()
@@ -21,8 +29,9 @@ class LoggerDefinition():
 
             formatter = colorlog.ColoredFormatter(
                 "%(log_color)s%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt='%H:%M:%S',
                 log_colors=log_colors)
-            
+
             ch.setFormatter(formatter)
             logger.addHandler(ch)
 